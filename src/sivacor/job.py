@@ -5,56 +5,157 @@ import sys
 from datetime import datetime
 from typing import List
 
-import dateutil.parser
 import typer
-import websockets
 from rich.console import Console
-from rich.table import Table
 from typing_extensions import Annotated
-from tzlocal import get_localzone
 
-from .lib import client
+from .lib import (
+    BOLD_GREEN,
+    BOLD_MAGENTA,
+    DIM,
+    _list_paged,
+    _parse_date,
+    _valid_token,
+    _write_json_list,
+    client,
+)
 
 console = Console()
 app = typer.Typer()
 
+LOG_QUEUE_SIZE = 1000
+LOG_BATCH_SIZE = 64
+LOG_BATCH_DELAY = 0.05
+
+# Close codes after which the log stream is reopened: going away, abnormal
+# closure, service restart and try again later
+RECONNECT_CODES = frozenset({1001, 1006, 1012, 1013})
+MAX_RECONNECT_DELAY = 30
+
+_STATUS = ("Inactive", "Queued", "Running", "Completed", "Failed", "Canceled")
+
+
+def _enqueue(queue: asyncio.Queue, item: str | None) -> None:
+    """Put an item on the queue, dropping the oldest one if it is full."""
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(item)
+
+
+async def _receive_logs(websocket, queue: asyncio.Queue) -> tuple[str, bool, bool]:
+    """
+    Reads log lines from the WebSocket into the queue until the connection
+    closes, and returns a message describing how it was closed together
+    with whether it is worth reconnecting and whether any line was received.
+    """
+    import websockets
+
+    received = False
+    try:
+        # This loop waits indefinitely for incoming messages
+        while True:
+            log_message = await websocket.recv()
+            if hasattr(log_message, "decode"):
+                log_message = log_message.decode("utf-8")
+            _enqueue(queue, log_message)
+            received = True
+    except websockets.exceptions.ConnectionClosed as e:
+        code = e.rcvd.code if e.rcvd else 1006
+        if isinstance(e, websockets.exceptions.ConnectionClosedOK):
+            status = "\nConnection closed gracefully by the server."
+        else:
+            reason = e.rcvd.reason if e.rcvd else ""
+            status = (
+                f"\nConnection closed unexpectedly (Code: {code}, Reason: {reason})."
+            )
+        return status, code in RECONNECT_CODES, received
+    finally:
+        _enqueue(queue, None)
+
+
+async def _print_logs(queue: asyncio.Queue) -> None:
+    """
+    Writes queued log lines to stdout in batches of up to LOG_BATCH_SIZE
+    lines or LOG_BATCH_DELAY seconds, whichever comes first.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await queue.get()]
+        deadline = loop.time() + LOG_BATCH_DELAY
+        while batch[-1] is not None and len(batch) < LOG_BATCH_SIZE:
+            # Take what is already queued directly, only wait when it runs dry
+            try:
+                line = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                try:
+                    line = await asyncio.wait_for(queue.get(), deadline - loop.time())
+                except asyncio.TimeoutError:
+                    break
+            batch.append(line)
+        lines = [f"| {line}\n" for line in batch if line is not None]
+        if lines:
+            sys.stdout.write("".join(lines))
+            sys.stdout.flush()
+        if batch[-1] is None:
+            return
+
 
 async def connect_to_job_stream(token):
     """
     Connects to the WebSocket server and listens for incoming log messages.
     """
+    import websockets
 
     api_url = os.environ.get("GIRDER_API_URL", "https://girder.sivacor.org/api/v1")
     ws_url = api_url.replace("http", "ws").replace("/api/v1", "/logs/docker?token=")
     print(f"Attempting to connect to WebSocket at: {ws_url}...")
 
+    attempt = 0
     try:
-        async with websockets.connect(ws_url + token) as websocket:
-            print("Connection successful! 🟢 Subscribed to log stream.")
-            print("=" * 60)
+        while True:
+            try:
+                async with websockets.connect(
+                    ws_url + token,
+                    compression="deflate",
+                    max_size=2**22,
+                    max_queue=LOG_BATCH_SIZE,
+                    ping_interval=20,
+                    ping_timeout=20,
+                ) as websocket:
+                    print("Connection successful! 🟢 Subscribed to log stream.")
+                    print("=" * 60)
 
-            # This loop waits indefinitely for incoming messages
-            while True:
-                try:
-                    # Receive a text message (your log line)
-                    log_message = await websocket.recv()
-                    if hasattr(log_message, "decode"):
-                        log_message = log_message.decode("utf-8")
-                    print(f"| {log_message}")
-
-                except websockets.exceptions.ConnectionClosedOK:
-                    print("\nConnection closed gracefully by the server.")
-                    break
-                except websockets.exceptions.ConnectionClosedError as e:
-                    print(
-                        f"\nConnection closed unexpectedly (Code: {e.code}, Reason: {e.reason})."
+                    queue = asyncio.Queue(maxsize=LOG_QUEUE_SIZE)
+                    (status, reconnect, received), _ = await asyncio.gather(
+                        _receive_logs(websocket, queue), _print_logs(queue)
                     )
-                    break
+                    print(status)
+                    # Only a stream that delivered logs counts as recovered,
+                    # a server closing right after the handshake keeps backing off
+                    if received:
+                        attempt = 0
+            except (OSError, websockets.exceptions.InvalidStatus) as e:
+                # While reconnecting, a restarting server may refuse the
+                # connection, time out or answer the handshake with a 5xx
+                if not attempt or (
+                    isinstance(e, websockets.exceptions.InvalidStatus)
+                    and e.response.status_code < 500
+                ):
+                    raise
+                print(f"Reconnect failed: {e}")
+                reconnect = True
+
+            if not reconnect:
+                break
+            delay = min(MAX_RECONNECT_DELAY, 2**attempt)
+            attempt += 1
+            print(f"Reconnecting in {delay}s (attempt {attempt})...")
+            await asyncio.sleep(delay)
 
     except ConnectionRefusedError:
         print(
             "\nConnection Refused: Ensure the Starlette server (uvicorn) is "
-            "running and accessible at {ws_url}."
+            f"running and accessible at {ws_url}."
         )
         sys.exit(1)
     except Exception as e:
@@ -66,6 +167,17 @@ async def connect_to_job_stream(token):
         print("WebSocket client debugger stopped.")
 
 
+def _make_job_table():
+    from rich.table import Table
+
+    table = Table(title="SIVACOR Jobs", show_header=True, header_style=BOLD_MAGENTA)
+    table.add_column("Job ID", style=BOLD_GREEN, min_width=20)
+    table.add_column("Title", style=DIM, min_width=40)
+    table.add_column("Status", justify="left")
+    table.add_column("Created", justify="left")
+    return table
+
+
 @app.command("list", help="List all submission jobs")
 def list_jobs(
     status: Annotated[
@@ -86,47 +198,65 @@ def list_jobs(
         datetime | None,
         typer.Option(help="Filter jobs created since this date", show_default=True),
     ] = None,
+    limit: Annotated[
+        int | None,
+        typer.Option(help="Only show the first N jobs", show_default=False, min=0),
+    ] = None,
+    offset: Annotated[
+        int,
+        typer.Option(help="Skip the first N jobs", show_default=True, min=0),
+    ] = 0,
+    page_size: Annotated[
+        int,
+        typer.Option(
+            help="Number of jobs fetched per request", show_default=True, min=1
+        ),
+    ] = 100,
 ) -> None:
+    from rich.live import Live
+    from tzlocal import get_localzone
+
     gc = client()
     local_tz = get_localzone()
     params = {}
+    # Girder expects JSON arrays here, compact ones keep the URL short
     if status:
-        params["statuses"] = jsonlib.dumps(status)
+        params["statuses"] = jsonlib.dumps(status, separators=(",", ":"))
     if types:
-        params["types"] = jsonlib.dumps(types)
+        params["types"] = jsonlib.dumps(types, separators=(",", ":"))
     if since:
         since = since.replace(tzinfo=local_tz, microsecond=0)
 
-    jobs = gc.listResource("job/all", params=params)
-    jobs = list(jobs)
-    table = Table(title="SIVACOR Jobs", show_header=True, header_style="bold magenta")
-    table.add_column("Job ID", style="bold green", min_width=20)
-    table.add_column("Title", style="dim", min_width=40)
-    table.add_column("Status", justify="left")
-    table.add_column("Created", justify="left")
-
-    for job in jobs:
-        created = dateutil.parser.parse(job["created"]).astimezone(local_tz)
-        if since and created < since:
-            continue
-        table.add_row(
-            job["_id"],
-            job["title"],
-            status_code_to_str(job["status"]),
-            job["created"][:16].replace("T", " "),
-        )
+    def jobs():
+        for job in _list_paged(
+            gc, "job/all", params, page_size=page_size, limit=limit, offset=offset
+        ):
+            if since and _parse_date(job["created"]) < since:
+                # Jobs are listed newest first, nothing older can follow
+                break
+            yield job
 
     if json:
-        console.print(jsonlib.dumps(jobs, indent=2))
-    else:
-        console.print(table)
+        _write_json_list(jobs(), console.file)
+        return
+
+    table = _make_job_table()
+
+    with Live(table, console=console, refresh_per_second=8):
+        for job in jobs():
+            table.add_row(
+                job["_id"],
+                job["title"],
+                status_code_to_str(job["status"]),
+                _fmt_ts_short(job["created"]),
+            )
 
 
 @app.command("stream", help="Show stdout/stderr of the current submission job")
 def stream_current_job() -> None:
     gc = client()
     try:
-        asyncio.run(connect_to_job_stream(gc.token))
+        asyncio.run(connect_to_job_stream(_valid_token(gc)))
     except KeyboardInterrupt:
         print("\n\nClient stopped by user (Ctrl+C)")
 
@@ -135,16 +265,13 @@ def stream_current_job() -> None:
 def get_job(job_id: str) -> None:
     gc = client()
     job = gc.getResource("job", job_id)
-    console.print_json(jsonlib.dumps(job, indent=2))
+    console.print_json(data=job)
+
+
+def _fmt_ts_short(value: str) -> str:
+    """Format an ISO-8601 timestamp as 'YYYY-MM-DD HH:MM'."""
+    return value[:10] + " " + value[11:16]
 
 
 def status_code_to_str(code: int) -> str:
-    status_map = {
-        0: "Inactive",
-        1: "Queued",
-        2: "Running",
-        3: "Completed",
-        4: "Failed",
-        5: "Canceled",
-    }
-    return status_map.get(code, "Unknown")
+    return _STATUS[code] if 0 <= code < len(_STATUS) else "Unknown"
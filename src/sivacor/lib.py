@@ -1,26 +1,235 @@
+import functools
+import hashlib
+import json
 import os
+import re
+import tempfile
+import textwrap
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Iterator, TextIO
 
 import typer
-from girder_client import GirderClient
+from girder_client import GirderClient, HttpError
+from rich.style import Style
 
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+
+except ImportError:
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+
+# Pre-parsed styles, so that rendering does not parse style strings
+DIM = Style(dim=True)
+CYAN = Style(color="cyan")
+BOLD_GREEN = Style(bold=True, color="green")
+BOLD_MAGENTA = Style(bold=True, color="magenta")
+
+TOKEN_CACHE = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+    "sivacor",
+    "token.json",
+)
+
+
+def _load_token_cache() -> dict:
+    try:
+        with open(TOKEN_CACHE) as fp:
+            return json.load(fp)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_token_cache(cache: dict) -> None:
+    """Atomically write the token cache, readable by the current user only."""
+    cache_dir = os.path.dirname(TOKEN_CACHE)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, prefix=".token-")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w") as fp:
+            json.dump(cache, fp)
+        os.chmod(tmp, 0o600)
+        os.replace(tmp, TOKEN_CACHE)
+    except OSError:
+        os.unlink(tmp)
+
+
+def _new_token(gc: GirderClient, api_key: str, cache_key: str) -> None:
+    """Authenticate with the API key and store the token in the cache."""
+    # Same request as gc.authenticate(apiKey=...), but keeps the token expiry
+    resp = gc.post("api_key/token", parameters={"key": api_key})
+    token = resp["authToken"]
+    gc.setToken(token["token"])
+    cache = _load_token_cache()
+    cache[cache_key] = {"token": token["token"], "expires": token["expires"]}
+    _save_token_cache(cache)
+
+
+class _CachedTokenClient(GirderClient):
+    """
+    GirderClient started with a token from the cache. If the server rejects
+    that token (revoked, or the token store was reset), a fresh one is
+    requested with the API key and the request is retried once.
+    """
+
+    def __init__(self, api_url: str, api_key: str, cache_key: str):
+        super().__init__(apiUrl=api_url)
+        self._api_key = api_key
+        self._cache_key = cache_key
+
+    def sendRestRequest(self, method, path, *args, **kwargs):
+        try:
+            return super().sendRestRequest(method, path, *args, **kwargs)
+        except HttpError as exc:
+            if exc.status != 401 or self._api_key is None:
+                raise
+        self._renew_token()
+        return super().sendRestRequest(method, path, *args, **kwargs)
+
+    def _renew_token(self) -> None:
+        """Drop the cached token and authenticate again with the API key."""
+        api_key, self._api_key = self._api_key, None
+        cache = _load_token_cache()
+        if cache.pop(self._cache_key, None):
+            _save_token_cache(cache)
+        self.setToken(None)
+        _new_token(self, api_key, self._cache_key)
+
+    def verify_token(self) -> None:
+        """Renew the cached token up front if the server no longer accepts it."""
+        if self._api_key is None:
+            return
+        # Girder answers null rather than 401 for an unknown token here
+        if not self.get("token/current"):
+            self._renew_token()
+
+
+@functools.lru_cache(maxsize=1)
+def _client(api_url: str, api_key: str, use_cache: bool) -> GirderClient:
+    if not use_cache:
+        gc = GirderClient(apiUrl=api_url)
+        gc.authenticate(apiKey=api_key)
+        return gc
+
+    cache_key = hashlib.sha256((api_url + api_key).encode()).hexdigest()
+    now = datetime.now(timezone.utc)
+    if entry := _load_token_cache().get(cache_key):
+        try:
+            expires = datetime.fromisoformat(entry["expires"])
+        except (KeyError, TypeError, ValueError):
+            expires = now
+        if expires > now + timedelta(seconds=60):
+            gc = _CachedTokenClient(api_url, api_key, cache_key)
+            gc.setToken(entry["token"])
+            return gc
 
-def client() -> GirderClient:
-    api_url = os.environ.get("GIRDER_API_URL", "https://girder.sivacor.org/api/v1")
     gc = GirderClient(apiUrl=api_url)
-    gc.authenticate(apiKey=os.environ["GIRDER_API_KEY"])
+    _new_token(gc, api_key, cache_key)
     return gc
 
 
+def client() -> GirderClient:
+    api_url = os.environ.get("GIRDER_API_URL", "https://girder.sivacor.org/api/v1")
+    return _client(
+        api_url,
+        os.environ["GIRDER_API_KEY"],
+        os.environ.get("SIVACOR_NO_TOKEN_CACHE", "") != "1",
+    )
+
+
+_FRACTION = re.compile(r"\.(\d+)")
+
+
+def _valid_token(gc: GirderClient) -> str:
+    """
+    Return a token the server accepts, for callers that use it outside of
+    REST requests, where a rejected cached token can't be retried.
+    """
+    if isinstance(gc, _CachedTokenClient):
+        gc.verify_token()
+    return gc.token
+
+
+def _parse_date(value: str) -> datetime:
+    """
+    Parse an ISO-8601 timestamp as returned by Girder or Docker.
+
+    A trailing ``Z`` is accepted and fractional seconds are cut or padded to
+    microseconds (Docker reports nanoseconds), so that
+    ``datetime.fromisoformat`` handles them on Python 3.10 as well.
+    """
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    value = _FRACTION.sub(lambda m: "." + m[1][:6].ljust(6, "0"), value, count=1)
+    return datetime.fromisoformat(value)
+
+
+def _list_paged(
+    gc: GirderClient,
+    path: str,
+    params: dict,
+    page_size: int = 100,
+    limit: int | None = None,
+    offset: int = 0,
+) -> Iterator[dict]:
+    """Yield records page by page, stopping after ``limit`` records."""
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    count = 0
+    while limit is None or count < limit:
+        page_limit = page_size if limit is None else min(page_size, limit - count)
+        records = gc.get(
+            path, parameters={**params, "limit": page_limit, "offset": offset}
+        )
+        yield from records
+        count += len(records)
+        offset += len(records)
+        if len(records) < page_limit:
+            break
+
+
+def _write_json_list(records: Iterable[dict], fp: TextIO) -> None:
+    """Write records as an indented JSON array without holding them in memory."""
+    sep = "[\n"
+    for record in records:
+        fp.write(sep + textwrap.indent(_dumps(record), "  "))
+        sep = ",\n"
+    fp.write("[]\n" if sep == "[\n" else "\n]\n")
+    fp.flush()
+
+
 def _get_submission_collection(gc: GirderClient) -> dict:
-    root_collection = gc.get("/collection", parameters={"name": "Submissions"})
+    root_collection = gc.get(
+        "/collection", parameters={"name": "Submissions", "limit": 1}
+    )
     if not root_collection:
         typer.echo("No 'Submissions' collection found!", err=True)
         raise typer.Abort()
     return root_collection[0]
 
 
-def _search_user(gc: GirderClient, user: str) -> dict:
-    typer.echo(f"Searching for user with text: {user}")
+def _lookup_login(gc: GirderClient, login: str) -> dict | None:
+    """Find a user by exact login, which avoids a full-text search."""
+    if "/" in login:
+        return None
+    try:
+        return gc.resourceLookup(f"/user/{login}")
+    except HttpError:
+        return None
+
+
+def _search_user_text(gc: GirderClient, user: str) -> dict:
+    typer.echo(f"Searching for user with text: {user}", err=True)
     users = gc.get(f"/user?text={user}")
     if not users:
         typer.echo(f"No user found with (search: {user})", err=True)
@@ -28,10 +237,11 @@ def _search_user(gc: GirderClient, user: str) -> dict:
     elif len(users) > 1:
         u = next((_ for _ in users if _.get("login") == user), None)
         if not u:
-            typer.echo("Found multiple users:")
+            typer.echo("Found multiple users:", err=True)
             for u in users:
                 typer.echo(
-                    f" - \"{u['firstName']} {u['lastName']}\" <{u['email']}> ({u['login']})"
+                    f" - \"{u['firstName']} {u['lastName']}\" <{u['email']}> ({u['login']})",
+                    err=True,
                 )
             typer.echo(
                 "Trying to search for user by their specific login name.", err=True
@@ -39,7 +249,14 @@ def _search_user(gc: GirderClient, user: str) -> dict:
             raise typer.Abort()
     else:
         u = users[0]
-    print(
-        f"Found user: \"{u['firstName']} {u['lastName']}\" <{u['email']}> ({u['login']})"
+    return u
+
+
+@functools.lru_cache(maxsize=128)
+def _search_user(gc: GirderClient, user: str) -> dict:
+    u = _lookup_login(gc, user) or _search_user_text(gc, user)
+    typer.echo(
+        f"Found user: \"{u['firstName']} {u['lastName']}\" <{u['email']}> ({u['login']})",
+        err=True,
     )
     return u
@@ -1,70 +1,100 @@
-import math
+import bisect
+import functools
 import json as jsonlib
-from dataclasses import dataclass
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from email.message import Message
 from enum import Enum
-from typing import List, Dict
+from types import MappingProxyType
+from typing import List, Mapping, NamedTuple, Tuple
 
-import dateutil.parser
 import typer
-from rich.columns import Columns
+from girder_client import GirderClient, HttpError
 from rich.console import Console
-from rich.padding import Padding
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
+from rich.markup import escape
 from typing_extensions import Annotated
-from tzlocal import get_localzone
 
-from .lib import _get_submission_collection, _search_user, client
+from .lib import (
+    BOLD_GREEN,
+    BOLD_MAGENTA,
+    CYAN,
+    DIM,
+    _dumps,
+    _get_submission_collection,
+    _list_paged,
+    _parse_date,
+    _search_user,
+    _write_json_list,
+    client,
+)
 
 app = typer.Typer()
 console = Console()
+_worker = threading.local()
+
+_TIME_FORMAT = "%Y-%m-%d %H:%M:%S %Z"
+# Large chunks keep the read/write syscall count low on multi-GB packages
+DOWNLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+@functools.lru_cache(maxsize=1)
+def _local_tz():
+    """Return the local timezone, looked up once and only when needed."""
+    from tzlocal import get_localzone
+
+    return get_localzone()
+
+
+@functools.lru_cache(maxsize=1024)
+def _local_time(value: str) -> datetime:
+    """Parse a Girder timestamp and convert it to the local timezone."""
+    return _parse_date(value).astimezone(_local_tz())
+
+
+@functools.lru_cache(maxsize=1024)
+def _local_time_str(value: str) -> str:
+    """Format a Girder timestamp in the local timezone for display."""
+    return _local_time(value).strftime(_TIME_FORMAT)
 
 
 def duration(start: datetime, end: datetime) -> str:
     delta = end - start
-    days, seconds = delta.days, delta.seconds
-    hours = seconds // 3600
-    minutes = (seconds % 3600) // 60
-    seconds = seconds % 60
-    parts = []
-    if days > 0:
-        parts.append(f"{days}d")
-    if hours > 0:
-        parts.append(f"{hours}h")
-    if minutes > 0:
-        parts.append(f"{minutes}m")
-    if seconds > 0 or not parts:
-        parts.append(f"{seconds}s")
-    return " ".join(parts)
+    hours, seconds = divmod(delta.seconds, 3600)
+    minutes, seconds = divmod(seconds, 60)
+    out = (
+        (f"{delta.days}d " if delta.days > 0 else "")
+        + (f"{hours}h " if hours else "")
+        + (f"{minutes}m " if minutes else "")
+    )
+    if seconds or not out:
+        return f"{out}{seconds}s"
+    return out[:-1]
+
+
+_POW1000 = tuple(1000**i for i in range(6))
+_SIZE_NAMES = {
+    True: ("B", "KiB", "MiB", "GiB", "TiB", "PiB"),
+    False: ("B", "KB", "MB", "GB", "TB", "PB"),
+}
 
 
 def convert_size(size_bytes, binary=True):
+    size_bytes = int(size_bytes)
     if size_bytes <= 0:
         return "0B"
     if binary:
-        suffix = "i"
-        base = 1024
+        i = min((size_bytes.bit_length() - 1) // 10, 5)
+        p = 1 << (10 * i)
     else:
-        suffix = ""
-        base = 1000
-    size_name = (
-        "B",
-        f"K{suffix}B",
-        f"M{suffix}B",
-        f"G{suffix}B",
-        f"T{suffix}B",
-        f"P{suffix}B",
-    )
-    i = int(math.floor(math.log(size_bytes, base)))
-    p = math.pow(base, i)
+        i = bisect.bisect_right(_POW1000, size_bytes) - 1
+        p = _POW1000[i]
     s = round(size_bytes / p, 2)
-    return "%s %s" % (s, size_name[i])
+    return "%s %s" % (s, _SIZE_NAMES[bool(binary)][i])
 
 
-@dataclass(frozen=True)
-class FileSpec:
+class FileSpec(NamedTuple):
     """Specification for a submission file type, consolidating all naming variants."""
 
     cli_name: str  # Used in CLI enum (e.g., "ReplPack")
@@ -72,11 +102,6 @@ class FileSpec:
     field_name: str  # Database field name (e.g., "replpack_file_id")
     api_type: str  # API metadata type (e.g., "replicated_package")
 
-    @property
-    def enum_value(self) -> str:
-        """Return the CLI enum value."""
-        return self.cli_name
-
 
 # Define all submission file specifications
 class SubmissionFiles:
@@ -119,32 +144,31 @@ class SubmissionFiles:
         api_type="tro_signature",
     )
 
+    # Lookup tables are built once, the specs are immutable
+    _ALL = (REPLPACK, STDOUT, STDERR, TRO, TSR, SIG)
+    _BY_CLI_NAME = MappingProxyType({spec.cli_name: spec for spec in _ALL})
+    _BY_API_TYPE = MappingProxyType({spec.api_type: spec for spec in _ALL})
+    _BY_DISPLAY_NAME = MappingProxyType({spec.display_name: spec for spec in _ALL})
+
     @classmethod
-    def all(cls) -> List[FileSpec]:
+    def all(cls) -> Tuple[FileSpec, ...]:
         """Return all file specifications."""
-        return [
-            cls.REPLPACK,
-            cls.STDOUT,
-            cls.STDERR,
-            cls.TRO,
-            cls.TSR,
-            cls.SIG,
-        ]
+        return cls._ALL
 
     @classmethod
-    def by_cli_name(cls) -> Dict[str, FileSpec]:
+    def by_cli_name(cls) -> Mapping[str, FileSpec]:
         """Return mapping from CLI name to FileSpec."""
-        return {spec.cli_name: spec for spec in cls.all()}
+        return cls._BY_CLI_NAME
 
     @classmethod
-    def by_api_type(cls) -> Dict[str, FileSpec]:
+    def by_api_type(cls) -> Mapping[str, FileSpec]:
         """Return mapping from API type to FileSpec."""
-        return {spec.api_type: spec for spec in cls.all()}
+        return cls._BY_API_TYPE
 
     @classmethod
-    def by_display_name(cls) -> Dict[str, FileSpec]:
+    def by_display_name(cls) -> Mapping[str, FileSpec]:
         """Return mapping from display name to FileSpec."""
-        return {spec.display_name: spec for spec in cls.all()}
+        return cls._BY_DISPLAY_NAME
 
 
 class SubmissionFile(str, Enum):
@@ -158,15 +182,112 @@ class SubmissionFile(str, Enum):
     TSR = "tsr"
     SIG = "sig"
 
+    @property
+    def spec(self) -> FileSpec:
+        """Return the FileSpec for this file type."""
+        return SubmissionFiles.by_cli_name()[self.value]
+
+
+_STATUS_ICONS = {
+    "submitted": "⏳",
+    "processing": "🔄",
+    "completed": "✅",
+    "failed": "❌",
+}
+
+
+# Submissions in these states are still running, their duration is open-ended
+_ACTIVE_STATUSES = frozenset({"submitted", "processing"})
+
 
 def status_icon(status: str) -> str:
-    status_map = {
-        "submitted": "⏳",
-        "processing": "🔄",
-        "completed": "✅",
-        "failed": "❌",
-    }
-    return status_map.get(status.lower(), "❓")
+    return _STATUS_ICONS.get(status.lower(), "❓")
+
+
+def _fetch_one(gc: GirderClient, file_id: str) -> str:
+    """Download a file in a single request, named after its Content-Disposition."""
+    resp = gc.sendRestRequest(
+        "GET", f"file/{file_id}/download", stream=True, jsonResp=False
+    )
+    header = Message()
+    header["Content-Disposition"] = resp.headers.get("Content-Disposition", "")
+    name = os.path.basename(header.get_filename() or file_id)
+    part = name + ".part"
+    try:
+        with open(part, "wb", buffering=DOWNLOAD_CHUNK_SIZE) as fp:
+            for chunk in resp.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                fp.write(chunk)
+    except BaseException:
+        # Don't leave a truncated file behind on errors or Ctrl+C
+        os.unlink(part)
+        raise
+    os.replace(part, name)
+    return name
+
+
+def _init_worker(api_url: str, token: str) -> None:
+    """Give each pool thread its own client, reusing the parent's token."""
+    _worker.gc = GirderClient(apiUrl=api_url)
+    _worker.gc.setToken(token)
+
+
+def _current_client() -> GirderClient:
+    """Return the calling pool thread's own client, or the shared one."""
+    return getattr(_worker, "gc", None) or client()
+
+
+def _get_in_worker(path: str):
+    return _worker.gc.get(path)
+
+
+def _fetch_in_worker(file_id: str) -> str:
+    return _fetch_one(_worker.gc, file_id)
+
+
+def _stage_image(stage: dict) -> str:
+    return f"{stage.get('image_name', 'N/A')}:{stage.get('image_tag', 'N/A')}"
+
+
+def _stage_images(stages: list) -> str:
+    if not stages:
+        return "N/A"
+    if len(stages) == 1:
+        return _stage_image(stages[0])
+    return ",".join(map(_stage_image, stages))
+
+
+def _make_submission_table():
+    from rich.table import Table
+
+    table = Table(
+        title="Submission Folders", show_header=True, header_style=BOLD_MAGENTA
+    )
+    table.add_column("Submission Name", style=BOLD_GREEN, min_width=20)
+    table.add_column("Job ID", style=DIM, min_width=24)
+    table.add_column("Image Tag", justify="left")
+    table.add_column("Creator", justify="left")
+    table.add_column("Created Date", justify="right", style=CYAN)
+    table.add_column("Duration", justify="right", style=CYAN)
+    table.add_column("Status", justify="center")
+    return table
+
+
+@functools.lru_cache(maxsize=512)
+def _user_by_id(uid: str) -> dict | None:
+    if not uid:
+        return None
+    try:
+        return _current_client().get(f"/user/{uid}")
+    except HttpError as exc:
+        if exc.status in (400, 404):
+            return None
+        raise
+
+
+def _user_label(uid: str) -> str:
+    if not (user := _user_by_id(uid)):
+        return "Unknown"
+    return f"{user['firstName']} {user['lastName']} ({user['login']})"
 
 
 @app.command("list", help="List all submissions")
@@ -200,34 +321,33 @@ def list_submissions(
     ] = None,
     head: Annotated[
         int | None,
-        typer.Option(help="Only show the first N submissions", show_default=False),
+        typer.Option(
+            help="Only show the first N submissions", show_default=False, min=0
+        ),
     ] = None,
+    offset: Annotated[
+        int,
+        typer.Option(help="Skip the first N submissions", show_default=True, min=0),
+    ] = 0,
+    page_size: Annotated[
+        int,
+        typer.Option(
+            help="Number of submissions fetched per request",
+            show_default=True,
+            min=1,
+        ),
+    ] = 100,
 ) -> None:
     # Dummy implementation for demonstration purposes
+    from rich.live import Live
+
     gc = client()
     if user:
         user_info = _search_user(gc, user)
-        console.print(f"[yellow]Filtering by user ID: {user_info['_id']}[/yellow]")
+        if not json:
+            console.print(f"[yellow]Filtering by user ID: {user_info['_id']}[/yellow]")
     if since:
-        since = since.replace(tzinfo=get_localzone(), microsecond=0)
-
-    if not json:
-        console.print("[bold cyan]🚀 Listing Submissions[/bold cyan]")
-    table = Table(
-        title="Submission Folders", show_header=True, header_style="bold magenta"
-    )
-    table.add_column("Submission Name", style="bold green", min_width=20)
-    table.add_column("Job ID", style="dim", min_width=24)
-    table.add_column("Image Tag", justify="left")
-    table.add_column("Creator", justify="left")
-    table.add_column("Created Date", justify="right", style="cyan")
-    table.add_column("Duration", justify="right", style="cyan")
-    table.add_column("Status", justify="center")
-
-    users = {
-        _["_id"]: f"{_['firstName']} {_['lastName']} ({_['login']})"
-        for _ in gc.listResource("user")
-    }
+        since = since.replace(tzinfo=_local_tz(), microsecond=0)
 
     root_collection = _get_submission_collection(gc)
     params = {
@@ -236,49 +356,50 @@ def list_submissions(
         "parentType": "collection",
         "parentId": root_collection["_id"],
     }
-    folders = []
-    for folder in gc.listResource("folder", params, limit=head):
-        created = dateutil.parser.parse(folder["created"]).astimezone(get_localzone())
-        if since and created < since:
-            continue
-        if user:
-            if folder["meta"].get("creator_id", "") != user_info["_id"]:
+    newest_first = sort == "created" and sortDir < 0
+
+    def folders():
+        for folder in _list_paged(
+            gc, "folder", params, page_size=page_size, limit=head, offset=offset
+        ):
+            if since and _parse_date(folder["created"]) < since:
+                if newest_first:
+                    # Nothing older than the cutoff can match, stop paging
+                    break
                 continue
-        if folder["meta"].get("status", "").lower() in ("submitted", "processing"):
-            updated = datetime.now(get_localzone())
-        else:
-            updated = dateutil.parser.parse(folder["updated"]).astimezone(
-                get_localzone()
-            )
-        folders.append(folder)
-        stages = folder["meta"].get("stages", [])
-        image = (
-            ",".join(
-                [
-                    f"{stage.get('image_name', 'N/A')}:{stage.get('image_tag', 'N/A')}"
-                    for stage in stages
-                ]
-            )
-            if stages
-            else "N/A"
-        )
-        table.add_row(
-            folder["name"],
-            folder["meta"].get("job_id", "N/A"),
-            image,
-            users.get(folder["meta"].get("creator_id", ""), "Unknown"),
-            created.strftime("%Y-%m-%d %H:%M:%S %Z"),
-            duration(
-                created,
-                updated,
-            ),
-            status_icon(folder["meta"].get("status", "unknown")),
-        )
+            if user:
+                if folder["meta"].get("creator_id", "") != user_info["_id"]:
+                    continue
+            yield folder
 
     if json:
-        console.print(jsonlib.dumps(folders, indent=2))
-    else:
-        console.print(table)
+        _write_json_list(folders(), console.file)
+        return
+
+    console.print("[bold cyan]🚀 Listing Submissions[/bold cyan]")
+    table = _make_submission_table()
+
+    with Live(table, console=console, refresh_per_second=8):
+        for folder in folders():
+            created = _local_time(folder["created"])
+            if folder["meta"].get("status", "").lower() in _ACTIVE_STATUSES:
+                updated = datetime.now(_local_tz())
+            else:
+                updated = _local_time(folder["updated"])
+            stages = folder["meta"].get("stages", [])
+            image = _stage_images(stages)
+            table.add_row(
+                folder["name"],
+                folder["meta"].get("job_id", "N/A"),
+                image,
+                _user_label(folder["meta"].get("creator_id", "")),
+                _local_time_str(folder["created"]),
+                duration(
+                    created,
+                    updated,
+                ),
+                status_icon(folder["meta"].get("status", "unknown")),
+            )
 
 
 @app.command(
@@ -303,6 +424,9 @@ def get_submission(
     ] = False,
 ) -> None:
     # Dummy implementation for demonstration purposes
+    from rich.padding import Padding
+    from rich.panel import Panel
+
     if not json:
         typer.echo("Getting a specific submission...")
     gc = client()
@@ -310,6 +434,8 @@ def get_submission(
     params = {
         "parentType": "collection",
         "parentId": root_collection["_id"],
+        # Only the first match is used, don't let the server send more
+        "limit": 1,
     }
     if "-" in submission:
         params["name"] = submission
@@ -318,7 +444,6 @@ def get_submission(
 
     folders = gc.get("/folder", parameters=params)
     folder = folders[0] if folders else None
-    job = gc.get(f"/job/{folder['meta']['job_id']}") if folder else None
 
     if not folder:
         console.print(
@@ -327,9 +452,23 @@ def get_submission(
         raise typer.Exit(code=1)
 
     if json:
-        console.print(jsonlib.dumps(folder, indent=2))
+        console.file.write(_dumps(folder) + "\n")
         return
 
+    # The job and the creator only depend on the folder, fetch them in the
+    # background while the items are processed. The main thread keeps using
+    # gc meanwhile, so the pool threads get their own clients
+    pool = ThreadPoolExecutor(
+        max_workers=2, initializer=_init_worker, initargs=(gc.urlBase, gc.token)
+    )
+    job_future = creator_future = None
+    if job_id := folder.get("meta", {}).get("job_id"):
+        job_future = pool.submit(_get_in_worker, f"/job/{job_id}")
+    if creator_id := folder.get("meta", {}).get("creator_id"):
+        creator_future = pool.submit(_user_by_id, creator_id)
+    # Submitted requests still run, the pool just takes no new work
+    pool.shutdown(wait=False)
+
     items = gc.get("/item", parameters={"folderId": folder["_id"]})
     performances = {}
     for item in items:
@@ -349,22 +488,23 @@ def get_submission(
     # 2. Display Core Summary
     meta = folder.get("meta", {})
 
-    summary_content = Text()
-    summary_content.append("Status: ", style="bold")
-    summary_content.append(f"{meta.get('status', 'N/A')}\n", style="yellow")
-    summary_content.append("Stages:\n", style="bold")
+    status = escape(str(meta.get("status", "N/A")))
+    lines = [
+        f"[bold]Status:[/bold] [yellow]{status}[/yellow]",
+        "[bold]Stages:[/bold]",
+    ]
     stages = meta.get("stages", [])
     for i, stage in enumerate(stages):
-        summary_content.append(f" {i+1}. ", style="bold")
-        summary_content.append("Image: ", style="dim")
-        summary_content.append(
-            f"{stage.get('image_name', 'N/A')}:{stage.get('image_tag')}\n",
-            style="magenta",
+        image = _stage_image(stage)
+        main_file = str(stage.get("main_file", "N/A"))
+        lines.append(
+            f"[bold] {i+1}. [/bold][dim]Image:[/dim] [magenta]{escape(image)}[/magenta]"
+        )
+        lines.append(
+            f"[dim]    Main File:[/dim] [magenta]{escape(main_file)}[/magenta]"
         )
-        summary_content.append("    Main File: ", style="dim")
-        summary_content.append(f"{stage.get('main_file', 'N/A')}\n", style="magenta")
         if performance := performances.get(str(i + 1)):
-            summary_content.append("    Performance Metrics:\n", style="dim")
+            lines.append("[dim]    Performance Metrics:[/dim]")
             for metric, value in performance.items():
                 if metric.startswith("ImageRepo"):
                     continue
@@ -374,56 +514,44 @@ def get_submission(
                     except ValueError:
                         value = "unknown"
                 elif metric in ("StartedAt", "FinishedAt"):
-                    value = (
-                        dateutil.parser.parse(value)
-                        .astimezone(get_localzone())
-                        .strftime("%Y-%m-%d %H:%M:%S %Z")
-                    )
-                summary_content.append(f"      - {metric}: {value}\n", style="cyan")
-    summary_content.append("Created: ", style="bold")
-    created = dateutil.parser.parse(folder["created"]).astimezone(get_localzone())
-    summary_content.append(
-        f"{created.strftime('%Y-%m-%d %H:%M:%S %Z')}\n",
-        style="cyan",
-    )
-    summary_content.append("Updated: ", style="bold")
-    updated = dateutil.parser.parse(folder["updated"]).astimezone(get_localzone())
-    summary_content.append(
-        f"{updated.strftime('%Y-%m-%d %H:%M:%S %Z')}\n", style="cyan"
-    )
-    if creator_id := meta.get("creator_id"):
-        creator = gc.get(f"/user/{creator_id}")
-        summary_content.append("\nSubmitted by: ", style="bold")
-        summary_content.append(
-            f"{creator.get('firstName')} {creator.get('lastName')}", style="green"
-        )
+                    value = _local_time_str(value)
+                lines.append(f"[cyan]      - {escape(f'{metric}: {value}')}[/cyan]")
+    created = _local_time_str(folder["created"])
+    updated = _local_time_str(folder["updated"])
+    lines.append(f"[bold]Created:[/bold] [cyan]{created}[/cyan]")
+    lines.append(f"[bold]Updated:[/bold] [cyan]{updated}[/cyan]")
+    if creator_future and (creator := creator_future.result()):
+        name = f"{creator.get('firstName')} {creator.get('lastName')}"
+        lines.append(f"\n[bold]Submitted by:[/bold] [green]{escape(name)}[/green]")
 
     summary_panel = Panel(
-        summary_content,
+        "\n".join(lines),
         title="[bold white]📝 Submission Summary[/bold white]",
         border_style="blue",
     )
     console.print(summary_panel)
 
-    if job:
+    if job_future and (job := job_future.result()):
         console.print("\n[bold]🔍 Main workflow job logs:[/bold]")
-        for line in job.get("log", []):
-            console.print(f"[dim]{line.strip()}[/dim]")
+        console.print(
+            "\n".join(line.strip() for line in job.get("log", [])),
+            style=DIM,
+            markup=False,
+        )
 
     # 3. Display File Downloads
     console.print(Padding("\n[bold]📦 Files Available for Download:[/bold]", (1, 0)))
 
-    # Build mapping from display name to file ID from submission metadata
-    file_id_map = {}
-    for spec in SubmissionFiles.all():
-        file_id = meta.get(spec.field_name)
-        if file_id:
-            file_id_map[spec.display_name] = file_id
+    # Build mapping from FileSpec to file ID from submission metadata
+    file_id_map = {
+        spec: file_id
+        for spec in SubmissionFiles.all()
+        if (file_id := meta.get(spec.field_name))
+    }
 
     # Build mapping from API type to FileSpec for easy lookup
     api_type_to_spec = SubmissionFiles.by_api_type()
 
-    # Create rich Text objects for the file list
     file_list = []
     for item in items:
         api_type = item.get("meta", {}).get("type")
@@ -433,42 +561,67 @@ def get_submission(
             continue
 
         display_name = spec.display_name
-        line = (
-            f"[bold white] - {display_name}:[/bold white] [dim]{item['name']}[/dim] "
+        name = escape(item["name"])
+        file_list.append(
+            f"[bold white] - {display_name}:[/bold white] [dim]{name}[/dim] "
             f"(size: [dim]{convert_size(item['size'])}[/dim]) "
             f"(Girder Item ID: [dim]{item['_id']}[/dim])"
         )
-        file_list.append(Text.from_markup(line))
 
-    console.print(Columns(file_list, expand=True, equal=True))
+    console.print("\n".join(file_list))
 
-    download = download or []
-    cli_name_to_spec = SubmissionFiles.by_cli_name()
+    # Ordered and deduplicated, so a file requested twice is fetched once
+    requested = dict.fromkeys(download or [])
 
     # If 'all' is specified, download all available files
-    if any(fetch.value == "all" for fetch in download):
-        download_specs = [
-            cli_name_to_spec[spec.cli_name] for spec in SubmissionFiles.all()
-        ]
+    if SubmissionFile.ALL in requested:
+        download_specs = SubmissionFiles.all()
     else:
-        download_specs = []
-        for fetch in download:
-            spec = cli_name_to_spec.get(fetch.value)
-            if not spec:
-                console.print(
-                    f"[bold red]Unknown file type: '{fetch.value}'[/bold red]"
-                )
-                continue
-            download_specs.append(spec)
+        download_specs = [fetch.spec for fetch in requested]
 
+    downloads = []
     for spec in download_specs:
-        file_id = file_id_map.get(spec.display_name)
+        file_id = file_id_map.get(spec)
         if not file_id:
             console.print(
                 f"[bold red]File '{spec.display_name}' not available for download.[/bold red]"
             )
             continue
+        downloads.append((spec, file_id))
+
+    if not downloads:
+        return
+
+    failed = []
+
+    def report(spec: FileSpec, fetch) -> None:
+        try:
+            name = fetch()
+        except HttpError as exc:
+            failed.append(spec)
+            console.print(
+                f"[bold red]Failed to download '{spec.display_name}': "
+                f"{exc.status}[/bold red]"
+            )
+        else:
+            console.print(f"Saved [bold]{spec.display_name}[/bold] as {name}")
 
+    if len(downloads) == 1:
+        spec, file_id = downloads[0]
         console.print(f"Downloading [bold]{spec.display_name}[/bold]...")
-        fobj = gc.get(f"/file/{file_id}")
-        gc.downloadFile(file_id, fobj["name"])
+        report(spec, lambda: _fetch_one(gc, file_id))
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(4, len(downloads)),
+            initializer=_init_worker,
+            initargs=(gc.urlBase, gc.token),
+        ) as ex:
+            futures = {}
+            for spec, file_id in downloads:
+                console.print(f"Downloading [bold]{spec.display_name}[/bold]...")
+                futures[ex.submit(_fetch_in_worker, file_id)] = spec
+            for future in as_completed(futures):
+                report(futures[future], future.result)
+
+    if failed:
+        raise typer.Exit(code=1)
@@ -1,9 +1,7 @@
-import json as jsonlib
 import typer
 from rich.console import Console
-from rich.table import Table
 from typing_extensions import Annotated
-from .lib import client
+from .lib import BOLD_GREEN, BOLD_MAGENTA, DIM, _write_json_list, client
 
 console = Console()
 app = typer.Typer()
@@ -16,17 +14,17 @@ def list_users(
         typer.Option(help="Output user list in JSON format", show_default=True),
     ] = False,
 ) -> None:
+    from rich.table import Table
+
     gc = client()
     users = gc.listResource("user")
     if json:
-        console.print(jsonlib.dumps(list(users), indent=2))
+        _write_json_list(users, console.file)
         return
 
-    table = Table(
-        title="SIVACOR Users", show_header=True, header_style="bold magenta"
-    )
-    table.add_column("Name", style="bold green", min_width=20)
-    table.add_column("Email", style="dim", min_width=24)
+    table = Table(title="SIVACOR Users", show_header=True, header_style=BOLD_MAGENTA)
+    table.add_column("Name", style=BOLD_GREEN, min_width=20)
+    table.add_column("Email", style=DIM, min_width=24)
     table.add_column("Last Job ID", justify="left")
     table.add_column("OAuth IDs", justify="left")
 
@@ -34,14 +32,11 @@ def list_users(
         oauth = {}
         if "oauth" in user:
             for _ in user["oauth"]:
-                oauth[_['provider']] = _["id"]
+                oauth[_["provider"]] = _["id"]
         table.add_row(
             f"{user['firstName']} {user['lastName']}",
             user.get("email", "N/A"),
             user.get("lastJobId", "N/A"),
-            ",".join(list(oauth.keys()))
+            ",".join(list(oauth.keys())),
         )
-    if json:
-        console.print(jsonlib.dumps(user, indent=2))
-    else:
-        console.print(table)
+    console.print(table)